@@ -1,4 +1,7 @@
+import collections
 import csv
+import functools
+import heapq
 import itertools
 import sys
 
@@ -36,6 +39,36 @@ PROBS = {
     "mutation": 0.01
 }
 
+# Unconditional probabilities for having gene, indexed by number of copies
+GENE_PRIOR = tuple(PROBS["gene"][count] for count in range(3))
+
+# Probability of trait, indexed by number of copies and trait (0 or 1)
+TRAIT_TABLE = tuple(
+    (PROBS["trait"][count][False], PROBS["trait"][count][True])
+    for count in range(3)
+)
+
+# Probability of a parent passing the gene on, given their number of copies
+PASS = (
+    PROBS["mutation"],
+    0.50,
+    1 - PROBS["mutation"]
+)
+
+# Probability distribution table for child gene,
+# indexed by mother's, father's and child's number of copies
+CHILD_TABLE = tuple(
+    tuple(
+        (
+            (1 - PASS[mg]) * (1 - PASS[fg]),
+            (PASS[mg] * (1 - PASS[fg])) + ((1 - PASS[mg]) * PASS[fg]),
+            PASS[mg] * PASS[fg]
+        )
+        for fg in range(3)
+    )
+    for mg in range(3)
+)
+
 
 def main():
 
@@ -44,54 +77,138 @@ def main():
         sys.exit("Usage: python heredity.py data.csv")
     people = load_data(sys.argv[1])
 
-    # Keep track of gene and trait probabilities for each person
+    # Compute gene and trait distributions for each person
+    probabilities = eliminate_probabilities(people)
+
+    # Print results
+    for person in people:
+        print(f"{person}:")
+        for field in probabilities[person]:
+            print(f"  {field.capitalize()}:")
+            for value in probabilities[person][field]:
+                p = probabilities[person][field][value]
+                print(f"    {value}: {p:.4f}")
+
+
+def enumerate_probabilities(people):
+    """
+    Return gene and trait distributions for each person in `people`,
+    computed by summing the joint probability of every assignment of
+    genes and unknown traits that agrees with the known traits.
+    """
+    names_list, mother_idx, father_idx, trait_obs = compile_pedigree(people)
+
+    # People whose trait is known are fixed by the evidence,
+    # only people with unknown trait need to be enumerated
+    unknown_trait = [i for i, t in enumerate(trait_obs) if t == -1]
+    known_mask = sum(1 << i for i, t in enumerate(trait_obs) if t == 1)
+    unknown_mask = sum(1 << i for i in unknown_trait)
+
+    # Every gene assignment, one count in {0, 1, 2} per person
+    assignments = list(itertools.product((0, 1, 2), repeat=len(names_list)))
+
+    # Joint probability of genes and known traits, which is the same
+    # for every set of unknown-trait people who might have the trait
+    gene_joints = joint_probabilities(
+        mother_idx, father_idx, assignments, trait_obs
+    )
+
+    # Keep track of gene and trait probabilities by position in names_list
+    gene_probs = [[0, 0, 0] for person in names_list]
+    trait_probs = [[0, 0] for person in names_list]
+
+    # Loop over all sets of unknown-trait people who might have the trait
+    for have_unknown_mask in submasks(unknown_mask):
+        have_trait_mask = known_mask | have_unknown_mask
+        trait_flags = [(have_trait_mask >> i) & 1 for i in range(len(names_list))]
+
+        # Add joint probability of every gene assignment to distributions
+        accumulate(
+            gene_probs, trait_probs, gene_joints, assignments,
+            unknown_trait, trait_flags
+        )
+
+    # Ensure probabilities sum to 1
+    normalize_rows(gene_probs)
+    normalize_rows(trait_probs)
+
+    # Convert accumulated values into gene and trait distributions
     probabilities = {
         person: {
             "gene": {
-                2: 0,
-                1: 0,
-                0: 0
+                2: gene_probs[i][2],
+                1: gene_probs[i][1],
+                0: gene_probs[i][0]
             },
             "trait": {
-                True: 0,
-                False: 0
+                True: trait_probs[i][1],
+                False: trait_probs[i][0]
             }
         }
-        for person in people
+        for i, person in enumerate(names_list)
     }
 
-    # Loop over all sets of people who might have the trait
-    names = set(people)
-    for have_trait in powerset(names):
+    return probabilities
 
-        # Check if current set of people violates known information
-        fails_evidence = any(
-            (people[person]["trait"] is not None and
-             people[person]["trait"] != (person in have_trait))
-            for person in names
-        )
-        if fails_evidence:
-            continue
-        
-        # Loop over all sets of people who might have the gene
-        for one_gene in powerset(names):
-            for two_genes in powerset(names - one_gene):
 
-                # Update probabilities with new joint probability
-                p = joint_probability(people, one_gene, two_genes, have_trait)
-                update(probabilities, one_gene, two_genes, have_trait, p)
+def eliminate_probabilities(people):
+    """
+    Return gene and trait distributions for each person in `people`,
+    computed exactly by variable elimination on the pedigree.
+    """
+    names_list, mother_idx, father_idx, trait_obs = compile_pedigree(people)
 
-    # Ensure probabilities sum to 1
-    normalize(probabilities)
+    # One factor per person: gene prior or transmission, times trait evidence
+    factors = []
+    for i, t in enumerate(trait_obs):
+        m = mother_idx[i]
+        f = father_idx[i]
 
-    # Print results
-    for person in people:
-        print(f"{person}:")
-        for field in probabilities[person]:
-            print(f"  {field.capitalize()}:")
-            for value in probabilities[person][field]:
-                p = probabilities[person][field][value]
-                print(f"    {value}: {p:.4f}")
+        # If person is parent
+        if m == -1:
+            factor = founder_factor(t)
+            factors.append(((i,), {
+                (count,): factor[count] for count in range(3)
+            }))
+
+        # If person is child
+        else:
+            factor = child_factor(t)
+            factors.append(((m, f, i), {
+                (mg, fg, count): factor[mg][fg][count]
+                for mg in range(3)
+                for fg in range(3)
+                for count in range(3)
+            }))
+
+    # Marginal gene distribution of everyone, from one pass each way
+    marginals = gene_marginals(factors, elimination_order(factors))
+
+    probabilities = {}
+    for i, person in enumerate(names_list):
+        gene = marginals[i]
+
+        # Trait is known, or follows from person's gene distribution
+        if trait_obs[i] == -1:
+            has_trait = sum(
+                gene[count] * TRAIT_TABLE[count][1] for count in range(3)
+            )
+        else:
+            has_trait = trait_obs[i]
+
+        probabilities[person] = {
+            "gene": {
+                2: gene[2],
+                1: gene[1],
+                0: gene[0]
+            },
+            "trait": {
+                True: has_trait,
+                False: 1 - has_trait
+            }
+        }
+
+    return probabilities
 
 
 def load_data(filename):
@@ -103,56 +220,113 @@ def load_data(filename):
     """
     data = dict()
     with open(filename) as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+
+        # Look up column positions once rather than building a dict per row
+        header = next(reader, None)
+        if header is None:
+            return data
+        name_col, mother_col, father_col, trait_col = (
+            header.index(field) for field in ("name", "mother", "father", "trait")
+        )
         for row in reader:
-            name = row["name"]
+
+            # Skip blank lines, and treat missing trailing fields as blank
+            if not row:
+                continue
+            row += [""] * (len(header) - len(row))
+
+            name = row[name_col]
             data[name] = {
                 "name": name,
-                "mother": row["mother"] or None,
-                "father": row["father"] or None,
-                "trait": (True if row["trait"] == "1" else
-                          False if row["trait"] == "0" else None)
+                "mother": row[mother_col] or None,
+                "father": row[father_col] or None,
+                "trait": (True if row[trait_col] == "1" else
+                          False if row[trait_col] == "0" else None)
             }
     return data
 
 
-def powerset(s):
+def compile_pedigree(people):
     """
-    Return a list of all possible subsets of set s.
+    Flatten `people` into parallel lists indexed by person position.
+    Return a tuple of names, mother index, father index and observed trait,
+    where a missing parent is -1 and trait is 1 or 0 if known, -1 otherwise.
     """
-    s = list(s)
-    return [
-        set(s) for s in itertools.chain.from_iterable(
-            itertools.combinations(s, r) for r in range(len(s) + 1)
-        )
+    names_list = list(people)
+    index = {person: i for i, person in enumerate(names_list)}
+
+    # Parents must both be blank, or both be people in the pedigree
+    for person in names_list:
+        if (people[person]["mother"] is None) != (people[person]["father"] is None):
+            raise ValueError(f"{person} must have both parents or neither")
+        for parent in (people[person]["mother"], people[person]["father"]):
+            if parent is not None and parent not in index:
+                raise ValueError(f"{person}'s parent {parent} is not listed")
+
+    mother_idx = [
+        index[people[person]["mother"]]
+        if people[person]["mother"] is not None else -1
+        for person in names_list
+    ]
+    father_idx = [
+        index[people[person]["father"]]
+        if people[person]["father"] is not None else -1
+        for person in names_list
+    ]
+    trait_obs = [
+        -1 if people[person]["trait"] is None else int(people[person]["trait"])
+        for person in names_list
     ]
 
+    # Raises if a cycle of parents would leave anyone out of the order
+    topo_order(mother_idx, father_idx)
 
-def prob_table():
-    """
-    Return a probability distribution table for child gene.
-    """
-    parent = {
-        0: 0.01,
-        1: 0.50,
-        2: 0.99
-    }
-
-    table = {}
-
-    for mg in range(3):
-        for fg in range(3):
-            entry = {}
-            a = (1 - parent[mg]) * (1 - parent[fg])
-            b = (parent[mg] * (1 - parent[fg])) + ((1 - parent[mg]) * parent[fg])
-            c = parent[mg] * parent[fg]
-            entry[0] = a
-            entry[1] = b
-            entry[2] = c
-            table[mg, fg] = entry
+    return names_list, mother_idx, father_idx, trait_obs
 
-    return table
 
+def topo_order(mother_idx, father_idx):
+    """
+    Return person indices sorted so that parents come before their children.
+    """
+    # Count unprocessed parents of each person and collect their children
+    waiting = [0] * len(mother_idx)
+    children = [[] for i in mother_idx]
+    for i, parents in enumerate(zip(mother_idx, father_idx)):
+        for parent in parents:
+            if parent != -1:
+                waiting[i] += 1
+                children[parent].append(i)
+
+    # Kahn's algorithm, starting from people without parents
+    queue = collections.deque(i for i, count in enumerate(waiting) if count == 0)
+    order = []
+    while queue:
+        i = queue.popleft()
+        order.append(i)
+        for child in children[i]:
+            waiting[child] -= 1
+            if waiting[child] == 0:
+                queue.append(child)
+
+    # Anyone left waiting is their own ancestor
+    if len(order) != len(mother_idx):
+        raise ValueError("pedigree contains a cycle of parents")
+
+    return order
+
+
+def submasks(mask):
+    """
+    Yield every subset of the bits set in `mask` as an integer bitmask,
+    from `mask` itself down to 0.
+    """
+    sub = mask
+    while True:
+        yield sub
+        if sub == 0:
+            break
+        sub = (sub - 1) & mask
 
 
 def joint_probability(people, one_gene, two_genes, have_trait):
@@ -166,84 +340,25 @@ def joint_probability(people, one_gene, two_genes, have_trait):
         * everyone in set `have_trait` has the trait, and
         * everyone not in set` have_trait` does not have the trait.
     """
-    # Get probability table for child gene
-    table = prob_table()
-
     # Initialize joint probability
     joint_p = 1
 
     # Loop over all person in people
     for person, value in people.items():
 
+        # Number of copies and trait flag, without branching on set membership
+        count = (person in one_gene) + 2 * (person in two_genes)
+        pt = TRAIT_TABLE[count][person in have_trait]
+
         # If person is parent
         if value['mother'] is None and value['father'] is None:
-
-            # Has trait
-            if person in have_trait:
-                if person in one_gene:
-                    pg = PROBS['gene'][1]
-                    pt = PROBS['trait'][1][True]
-                elif person in two_genes:
-                    pg = PROBS['gene'][2]
-                    pt = PROBS['trait'][2][True]
-                else:
-                    pg = PROBS['gene'][0]
-                    pt = PROBS['trait'][0][True]
-
-            # Doesn't have trait
-            else:
-                if person in one_gene:
-                    pg = PROBS['gene'][1]
-                    pt = PROBS['trait'][1][False]
-                elif person in two_genes:
-                    pg = PROBS['gene'][2]
-                    pt = PROBS['trait'][2][False]
-                else:
-                    pg = PROBS['gene'][0]
-                    pt = PROBS['trait'][0][False]
+            pg = GENE_PRIOR[count]
 
         # If person is child
         else:
-
-            # Get mother's number of copies
-            if value['mother'] in one_gene:
-                mg = 1
-            elif value['mother'] in two_genes:
-                mg = 2
-            else:
-                mg = 0
-            
-            # Get father's number of copies
-            if value['father'] in one_gene:
-                fg = 1
-            elif value['father'] in two_genes:
-                fg = 2
-            else:
-                fg = 0
-
-            # Has trait
-            if person in have_trait:
-                if person in one_gene:
-                    pt = PROBS['trait'][1][True]
-                    pg = table[mg, fg][1]
-                elif person in two_genes:
-                    pt = PROBS['trait'][2][True]
-                    pg = table[mg, fg][2]
-                else:
-                    pt = PROBS['trait'][0][True]
-                    pg = table[mg, fg][0]
-
-            # Doesn't have trait
-            else:
-                if person in one_gene:
-                    pt = PROBS['trait'][1][False]
-                    pg = table[mg, fg][1]
-                elif person in two_genes:
-                    pt = PROBS['trait'][2][False]
-                    pg = table[mg, fg][2]
-                else:
-                    pt = PROBS['trait'][0][False]
-                    pg = table[mg, fg][0]
+            mg = (value['mother'] in one_gene) + 2 * (value['mother'] in two_genes)
+            fg = (value['father'] in one_gene) + 2 * (value['father'] in two_genes)
+            pg = CHILD_TABLE[mg][fg][count]
 
         p = pt * pg
         joint_p *= p
@@ -251,6 +366,261 @@ def joint_probability(people, one_gene, two_genes, have_trait):
     return joint_p
 
 
+def joint_probabilities(mother_idx, father_idx, assignments, trait_flags):
+    """
+    Compute and return the joint probability of every gene assignment.
+
+    Each assignment in `assignments` is a tuple giving the number of gene
+    copies of every person, by position in the compiled pedigree, and
+    `trait_flags` gives 1 for every person who has the trait, 0 if they
+    do not, or -1 to leave their trait out of the joint probability.
+    Returns a list of joint probabilities, one per assignment.
+    """
+    # Initialize joint probability of every assignment
+    joints = [1] * len(assignments)
+
+    # Multiply in one person's factor across all assignments at a time
+    for i, (m, f) in enumerate(zip(mother_idx, father_idx)):
+
+        # If person is parent
+        if m == -1:
+            factor = founder_factor(trait_flags[i])
+            joints = [
+                joint_p * factor[g[i]]
+                for joint_p, g in zip(joints, assignments)
+            ]
+
+        # If person is child
+        else:
+            factor = child_factor(trait_flags[i])
+            joints = [
+                joint_p * factor[g[m]][g[f]][g[i]]
+                for joint_p, g in zip(joints, assignments)
+            ]
+
+    return joints
+
+
+@functools.lru_cache(maxsize=None)
+def trait_likelihood(trait):
+    """
+    Return the probability of observing `trait` given each gene count.
+    `trait` is 1 or 0 if known, or -1 if unknown, in which case every
+    gene count is equally consistent with it.
+    """
+    return tuple(
+        1 if trait == -1 else TRAIT_TABLE[count][trait]
+        for count in range(3)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def founder_factor(trait):
+    """
+    Return the probability of a person without parents listed
+    having each gene count and trait `trait`.
+    """
+    likelihood = trait_likelihood(trait)
+    return tuple(GENE_PRIOR[count] * likelihood[count] for count in range(3))
+
+
+@functools.lru_cache(maxsize=None)
+def child_factor(trait):
+    """
+    Return the probability of a child having each gene count and
+    trait `trait`, indexed by mother's, father's and child's copies.
+    """
+    likelihood = trait_likelihood(trait)
+    return tuple(
+        tuple(
+            tuple(
+                CHILD_TABLE[mg][fg][count] * likelihood[count]
+                for count in range(3)
+            )
+            for fg in range(3)
+        )
+        for mg in range(3)
+    )
+
+
+def accumulate(gene_probs, trait_probs, gene_joints, assignments,
+               unknown_trait, trait_flags):
+    """
+    Add to `gene_probs` and `trait_probs` the joint probability of every
+    gene assignment in `assignments` for the trait flags `trait_flags`.
+    `gene_joints` holds each assignment's joint probability without the
+    traits of people in `unknown_trait`, whose trait factors are applied here.
+    Both accumulators are lists indexed by person position, holding one
+    value per gene count and one value per trait flag (0 or 1) respectively.
+    """
+    joints = gene_joints
+    for i in unknown_trait:
+        likelihood = trait_likelihood(trait_flags[i])
+        joints = [
+            joint_p * likelihood[g[i]]
+            for joint_p, g in zip(joints, assignments)
+        ]
+
+    # Add each assignment's joint probability to everyone's gene count
+    for joint_p, g in zip(joints, assignments):
+        for i in range(len(gene_probs)):
+            gene_probs[i][g[i]] += joint_p
+
+    # Trait flags are the same for every assignment, so add the total once
+    total = sum(joints)
+    for i, has_trait in enumerate(trait_flags):
+        trait_probs[i][has_trait] += total
+
+    return None
+
+
+def contract(factors, variables, eliminated):
+    """
+    Return the product of `factors` summed over the gene counts of every
+    variable in `eliminated`, as a table over `variables`.
+    Each factor is a tuple of its variables and a dict mapping
+    their gene counts to a value.
+    """
+    # Position of each factor's variables within the full assignment
+    full = variables + eliminated
+    positions = [
+        tuple(full.index(v) for v in factor_vars)
+        for factor_vars, factor_table in factors
+    ]
+    counts = list(itertools.product(range(3), repeat=len(eliminated)))
+
+    table = {}
+    for values in itertools.product(range(3), repeat=len(variables)):
+        total = 0
+        for count in counts:
+            full_values = values + count
+            p = 1
+            for position, (factor_vars, factor_table) in zip(positions, factors):
+                p *= factor_table[tuple(full_values[k] for k in position)]
+            total += p
+        table[values] = total
+
+    return table
+
+
+def normalize_table(table):
+    """
+    Return `table` scaled so that its values sum to 1.
+    """
+    scale = 1 / sum(table.values())
+    return {values: p * scale for values, p in table.items()}
+
+
+def multiply_normalized(factors, scope):
+    """
+    Return the product of `factors` as a factor over `scope`, normalized
+    after every multiplication so that long products cannot underflow.
+    """
+    table = dict.fromkeys(itertools.product(range(3), repeat=len(scope)), 1)
+    for factor in factors:
+        table = normalize_table(contract([(scope, table), factor], scope, ()))
+    return (scope, table)
+
+
+def elimination_order(factors):
+    """
+    Return every variable in `factors`, ordered greedily so that each
+    variable eliminated has the fewest remaining neighbours.
+    """
+    # Variables are neighbours if they share a factor
+    neighbours = collections.defaultdict(set)
+    for factor_vars, factor_table in factors:
+        for v in factor_vars:
+            neighbours[v].update(u for u in factor_vars if u != v)
+
+    # Heap of (neighbour count, variable), with stale entries skipped
+    heap = [(len(adjacent), v) for v, adjacent in neighbours.items()]
+    heapq.heapify(heap)
+    order = []
+    eliminated = set()
+    while heap:
+        count, variable = heapq.heappop(heap)
+        if variable in eliminated or count != len(neighbours[variable]):
+            continue
+        eliminated.add(variable)
+        order.append(variable)
+
+        # Summing out connects all of its neighbours to each other
+        adjacent = neighbours.pop(variable)
+        for v in adjacent:
+            neighbours[v].discard(variable)
+            neighbours[v].update(u for u in adjacent if u != v)
+            heapq.heappush(heap, (len(neighbours[v]), v))
+
+    return order
+
+
+def gene_marginals(factors, order):
+    """
+    Return the normalized gene distribution of every variable in `factors`,
+    as a dict mapping variable to a list indexed by gene count.
+
+    Variables are summed out in `order`, each sending a message to the
+    bucket of the next variable it shares a factor with. Messages are then
+    passed back down the same tree, so every bucket sees all the evidence.
+    Every message is normalized to keep large pedigrees from underflowing.
+    """
+    position = {v: k for k, v in enumerate(order)}
+
+    # Each factor belongs to the bucket of its first eliminated variable
+    potentials = [[] for v in order]
+    for factor in factors:
+        potentials[min(position[v] for v in factor[0])].append(factor)
+
+    # Upward pass, from the first eliminated variable to the last
+    scopes = [None] * len(order)
+    children = [[] for v in order]
+    up = [None] * len(order)
+    for k, variable in enumerate(order):
+        local = potentials[k] + [up[c] for c in children[k]]
+        scopes[k] = tuple(sorted({v for factor in local for v in factor[0]}))
+        kept = tuple(v for v in scopes[k] if v != variable)
+        combined = multiply_normalized(local, scopes[k])
+        up[k] = (kept, normalize_table(contract([combined], kept, (variable,))))
+        if kept:
+            children[min(position[v] for v in kept)].append(k)
+
+    # Downward pass, from the last eliminated variable to the first
+    down = [None] * len(order)
+    marginals = {}
+    for k in reversed(range(len(order))):
+        scope = scopes[k]
+        outside = potentials[k] + ([down[k]] if down[k] is not None else [])
+
+        # Products of the messages before and after each child, so each
+        # child's message leaves out its own without redoing the rest
+        messages = [up[c] for c in children[k]]
+        prefix = [multiply_normalized([], scope)]
+        for message in messages:
+            prefix.append(multiply_normalized([prefix[-1], message], scope))
+        suffix = [prefix[0]]
+        for message in reversed(messages):
+            suffix.append(multiply_normalized([suffix[-1], message], scope))
+        suffix.reverse()
+
+        for j, child in enumerate(children[k]):
+            combined = multiply_normalized(
+                outside + [prefix[j], suffix[j + 1]], scope
+            )
+            kept = up[child][0]
+            summed = tuple(v for v in scope if v not in kept)
+            down[child] = (kept, normalize_table(contract([combined], kept, summed)))
+
+        # Variable's marginal combines its bucket with every message in
+        variable = order[k]
+        combined = multiply_normalized(outside + [prefix[-1]], scope)
+        summed = tuple(v for v in scope if v != variable)
+        gene = normalize_table(contract([combined], (variable,), summed))
+        marginals[variable] = [gene[(count,)] for count in range(3)]
+
+    return marginals
+
+
 def update(probabilities, one_gene, two_genes, have_trait, p):
     """
     Add to `probabilities` a new joint probability `p`.
@@ -260,30 +630,9 @@ def update(probabilities, one_gene, two_genes, have_trait, p):
     """
     # Loop over all person in probabilities
     for person in probabilities:
-        
-        # Has trait
-        if person in have_trait:
-            if person in one_gene:
-                probabilities[person]['trait'][True] += p
-                probabilities[person]['gene'][1] += p
-            elif person in two_genes:
-                probabilities[person]['trait'][True] += p
-                probabilities[person]['gene'][2] += p
-            else:
-                probabilities[person]['trait'][True] += p
-                probabilities[person]['gene'][0] += p
-        
-        # Doesn't have trait
-        else:
-            if person in one_gene:
-                probabilities[person]['trait'][False] += p
-                probabilities[person]['gene'][1] += p
-            elif person in two_genes:
-                probabilities[person]['trait'][False] += p
-                probabilities[person]['gene'][2] += p
-            else:
-                probabilities[person]['trait'][False] += p
-                probabilities[person]['gene'][0] += p
+        count = (person in one_gene) + 2 * (person in two_genes)
+        probabilities[person]['trait'][person in have_trait] += p
+        probabilities[person]['gene'][count] += p
 
     return None
 
@@ -297,8 +646,8 @@ def normalize(probabilities):
     for person in probabilities:
 
         # Calculate scaling factor
-        scale_gene = 1 / sum(list(probabilities[person]['gene'].values()))
-        scale_trait = 1/ sum(list(probabilities[person]['trait'].values()))
+        scale_gene = 1 / sum(probabilities[person]['gene'].values())
+        scale_trait = 1 / sum(probabilities[person]['trait'].values())
 
         # Update values in gene
         for value in probabilities[person]['gene'].keys():
@@ -311,5 +660,17 @@ def normalize(probabilities):
     return None
 
 
+def normalize_rows(rows):
+    """
+    Update each list in `rows` such that it sums to 1,
+    with relative proportions the same.
+    """
+    for row in rows:
+        scale = 1 / sum(row)
+        row[:] = [value * scale for value in row]
+
+    return None
+
+
 if __name__ == "__main__":
     main()
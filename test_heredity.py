@@ -0,0 +1,304 @@
+import itertools
+import os
+import random
+import tempfile
+import unittest
+
+import heredity
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+def random_people(rng, n):
+    """
+    Return a random pedigree of n people, where every child's parents
+    are two distinct earlier people and any trait may be unknown.
+    """
+    names = [f"P{i}" for i in range(n)]
+    people = {}
+    for i, name in enumerate(names):
+        if i >= 2 and rng.random() < 0.7:
+            mother, father = rng.sample(names[:i], 2)
+        else:
+            mother = father = None
+        people[name] = {
+            "name": name,
+            "mother": mother,
+            "father": father,
+            "trait": rng.choice([True, False, None])
+        }
+
+    # Children may come before their parents in the file
+    items = list(people.items())
+    rng.shuffle(items)
+    return dict(items)
+
+
+class LoadDataTest(unittest.TestCase):
+
+    def load(self, text):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "family.csv")
+            with open(filename, "w") as f:
+                f.write(text)
+            return heredity.load_data(filename)
+
+    def test_blank_lines_are_skipped(self):
+        people = self.load(
+            "name,mother,father,trait\nJames,,,1\n\nLily,,,0\n\n"
+        )
+        self.assertEqual(list(people), ["James", "Lily"])
+
+    def test_missing_trailing_fields_are_blank(self):
+        people = self.load(
+            "name,mother,father,trait\nHarry,Lily,James\nJames,,,1\nLily,,,0\n"
+        )
+        self.assertEqual(people["Harry"], {
+            "name": "Harry", "mother": "Lily", "father": "James", "trait": None
+        })
+
+    def test_empty_file_has_no_people(self):
+        self.assertEqual(self.load(""), {})
+
+
+class PedigreeTest(unittest.TestCase):
+
+    def test_topo_order_puts_parents_first(self):
+        order = heredity.topo_order([2, -1, -1], [1, -1, -1])
+        self.assertLess(order.index(2), order.index(0))
+        self.assertLess(order.index(1), order.index(0))
+
+    def test_topo_order_rejects_cycle(self):
+        with self.assertRaises(ValueError):
+            heredity.topo_order([-1, 2, 1], [-1, 0, 0])
+
+    def test_cycle_is_rejected_by_elimination(self):
+        people = {
+            "P0": {"name": "P0", "mother": None, "father": None,
+                   "trait": None},
+            "P1": {"name": "P1", "mother": "P2", "father": "P0",
+                   "trait": None},
+            "P2": {"name": "P2", "mother": "P1", "father": "P0",
+                   "trait": None}
+        }
+        with self.assertRaises(ValueError):
+            heredity.eliminate_probabilities(people)
+
+    def test_single_parent_is_rejected(self):
+        people = {
+            "Lily": {"name": "Lily", "mother": None, "father": None,
+                     "trait": None},
+            "Harry": {"name": "Harry", "mother": "Lily", "father": None,
+                      "trait": None}
+        }
+        with self.assertRaises(ValueError):
+            heredity.compile_pedigree(people)
+
+    def test_unlisted_parent_is_rejected(self):
+        people = {
+            "Lily": {"name": "Lily", "mother": None, "father": None,
+                     "trait": None},
+            "Harry": {"name": "Harry", "mother": "Lily", "father": "James",
+                      "trait": None}
+        }
+        with self.assertRaises(ValueError):
+            heredity.compile_pedigree(people)
+
+
+def empty_probabilities(people):
+    """
+    Return zeroed gene and trait distributions for each person in `people`.
+    """
+    return {
+        person: {"gene": {2: 0, 1: 0, 0: 0}, "trait": {True: 0, False: 0}}
+        for person in people
+    }
+
+
+def brute_force_probabilities(people):
+    """
+    Return gene and trait distributions for each person in `people`,
+    summed over every set of genes and traits with `joint_probability`,
+    `update` and `normalize`.
+    """
+    def subsets(s):
+        s = list(s)
+        return [
+            set(subset) for subset in itertools.chain.from_iterable(
+                itertools.combinations(s, r) for r in range(len(s) + 1)
+            )
+        ]
+
+    probabilities = empty_probabilities(people)
+    names = set(people)
+    for have_trait in subsets(names):
+        if any(
+            people[person]["trait"] is not None and
+            people[person]["trait"] != (person in have_trait)
+            for person in names
+        ):
+            continue
+        for one_gene in subsets(names):
+            for two_genes in subsets(names - one_gene):
+                p = heredity.joint_probability(
+                    people, one_gene, two_genes, have_trait
+                )
+                heredity.update(
+                    probabilities, one_gene, two_genes, have_trait, p
+                )
+    heredity.normalize(probabilities)
+    return probabilities
+
+
+class AssignmentApiTest(unittest.TestCase):
+
+    def setUp(self):
+        self.people = heredity.load_data(os.path.join(DATA, "family0.csv"))
+
+    def test_joint_probability(self):
+        p = heredity.joint_probability(
+            self.people, {"Harry"}, {"James"}, {"James"}
+        )
+        self.assertAlmostEqual(p, 0.0026643247488, places=15)
+
+    def test_update(self):
+        probabilities = empty_probabilities(self.people)
+        heredity.update(probabilities, {"Harry"}, {"James"}, {"James"}, 0.1)
+        heredity.update(probabilities, set(), {"Lily"}, {"Harry"}, 0.3)
+        self.assertEqual(probabilities["Harry"], {
+            "gene": {2: 0, 1: 0.1, 0: 0.3}, "trait": {True: 0.3, False: 0.1}
+        })
+        self.assertEqual(probabilities["James"], {
+            "gene": {2: 0.1, 1: 0, 0: 0.3}, "trait": {True: 0.1, False: 0.3}
+        })
+        self.assertEqual(probabilities["Lily"], {
+            "gene": {2: 0.3, 1: 0, 0: 0.1}, "trait": {True: 0, False: 0.4}
+        })
+
+    def test_normalize(self):
+        probabilities = empty_probabilities(self.people)
+        heredity.update(probabilities, {"Harry"}, {"James"}, {"James"}, 0.1)
+        heredity.update(probabilities, set(), {"Lily"}, {"Harry"}, 0.3)
+        heredity.normalize(probabilities)
+        self.assertEqual(probabilities["Harry"], {
+            "gene": {2: 0, 1: 0.25, 0: 0.75},
+            "trait": {True: 0.75, False: 0.25}
+        })
+        self.assertEqual(probabilities["Lily"], {
+            "gene": {2: 0.75, 1: 0, 0: 0.25}, "trait": {True: 0, False: 1}
+        })
+
+
+class ProbabilitiesMixin:
+
+    def assertSameProbabilities(self, expected, actual, places=9):
+        self.assertEqual(expected.keys(), actual.keys())
+        for person in expected:
+            for field in expected[person]:
+                for value in expected[person][field]:
+                    self.assertAlmostEqual(
+                        expected[person][field][value],
+                        actual[person][field][value],
+                        places=places,
+                        msg=f"{person} {field} {value}"
+                    )
+
+
+class EliminationTest(ProbabilitiesMixin, unittest.TestCase):
+
+    def test_bundled_data_matches_enumeration(self):
+        for filename in ("family0.csv", "family1.csv", "family2.csv"):
+            people = heredity.load_data(os.path.join(DATA, filename))
+            self.assertSameProbabilities(
+                heredity.enumerate_probabilities(people),
+                heredity.eliminate_probabilities(people)
+            )
+
+    def test_random_pedigrees_match_enumeration(self):
+        rng = random.Random(0)
+        for trial in range(100):
+            people = random_people(rng, rng.randint(1, 7))
+            self.assertSameProbabilities(
+                heredity.enumerate_probabilities(people),
+                heredity.eliminate_probabilities(people)
+            )
+
+    def test_many_observed_founders_do_not_underflow(self):
+        people = {
+            f"F{i}": {"name": f"F{i}", "mother": None, "father": None,
+                      "trait": True}
+            for i in range(300)
+        }
+        single = heredity.eliminate_probabilities({"F0": people["F0"]})
+        self.assertSameProbabilities(
+            single, {"F0": heredity.eliminate_probabilities(people)["F0"]}
+        )
+
+    def test_many_observed_children_do_not_underflow(self):
+        people = {
+            "Mother": {"name": "Mother", "mother": None, "father": None,
+                       "trait": None},
+            "Father": {"name": "Father", "mother": None, "father": None,
+                       "trait": None}
+        }
+        for i in range(500):
+            people[f"C{i}"] = {"name": f"C{i}", "mother": "Mother",
+                               "father": "Father", "trait": True}
+        probabilities = heredity.eliminate_probabilities(people)
+        self.assertAlmostEqual(sum(probabilities["Mother"]["gene"].values()), 1)
+        self.assertGreater(probabilities["Mother"]["gene"][2], 0.99)
+
+
+class BruteForceTest(ProbabilitiesMixin, unittest.TestCase):
+
+    def pedigrees(self):
+        rng = random.Random(2)
+        pedigrees = [
+            heredity.load_data(os.path.join(DATA, filename))
+            for filename in ("family0.csv", "family1.csv", "family2.csv")
+        ]
+        pedigrees += [
+            random_people(rng, rng.randint(1, 5)) for trial in range(5)
+        ]
+        return pedigrees
+
+    def test_enumeration_matches_brute_force(self):
+        for people in self.pedigrees():
+            self.assertSameProbabilities(
+                brute_force_probabilities(people),
+                heredity.enumerate_probabilities(people)
+            )
+
+    def test_elimination_matches_brute_force(self):
+        for people in self.pedigrees():
+            self.assertSameProbabilities(
+                brute_force_probabilities(people),
+                heredity.eliminate_probabilities(people)
+            )
+
+    def test_family0_matches_readme(self):
+        people = heredity.load_data(os.path.join(DATA, "family0.csv"))
+        expected = {
+            "Harry": {"gene": {2: "0.0092", 1: "0.4557", 0: "0.5351"},
+                      "trait": {True: "0.2665", False: "0.7335"}},
+            "James": {"gene": {2: "0.1976", 1: "0.5106", 0: "0.2918"},
+                      "trait": {True: "1.0000", False: "0.0000"}},
+            "Lily": {"gene": {2: "0.0036", 1: "0.0136", 0: "0.9827"},
+                     "trait": {True: "0.0000", False: "1.0000"}}
+        }
+        for probabilities in (brute_force_probabilities(people),
+                              heredity.eliminate_probabilities(people)):
+            self.assertEqual(expected, {
+                person: {
+                    field: {
+                        value: f"{p:.4f}"
+                        for value, p in probabilities[person][field].items()
+                    }
+                    for field in probabilities[person]
+                }
+                for person in probabilities
+            })
+
+
+if __name__ == "__main__":
+    unittest.main()